@@ -5,12 +5,33 @@ This module provides adapters for various data sources:
 - YahooFinanceAdapter: Stock prices and company information
 - NewsAdapter: News articles with sentiment analysis
 - SECAdapter: SEC regulatory filings
+
+Independent adapter calls can be issued concurrently with gather().
 """
 
 from .base import baseDataAdapter, APIDataAdapter
-from .yahoo import YahooFinanceAdapter
-from .news import NewsAdapter
-from .sec import SECAdapter
+from .parallel import gather
+
+# Concrete adapters are imported on first access (PEP 562) so that, e.g.,
+# using SECAdapter does not pay for importing yfinance, numpy or pandas.
+_LAZY_ADAPTERS = {
+    'YahooFinanceAdapter': '.yahoo',
+    'NewsAdapter': '.news',
+    'SECAdapter': '.sec',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ADAPTERS:
+        from importlib import import_module
+        adapter = getattr(import_module(_LAZY_ADAPTERS[name], __name__), name)
+        globals()[name] = adapter
+        return adapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ADAPTERS))
 
 __all__ = [
     'baseDataAdapter',
@@ -18,6 +39,7 @@ __all__ = [
     'YahooFinanceAdapter',
     'NewsAdapter',
     'SECAdapter',
+    'gather',
 ]
 
 __version__ = '1.0.0'
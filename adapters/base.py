@@ -3,9 +3,11 @@ Base adapter classes for data retrieval with health checks and API fallback.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any, Dict
+import io
 import os
-import pandas as pd
+import sys
 
 
 class baseDataAdapter(ABC):
@@ -15,14 +17,28 @@ class baseDataAdapter(ABC):
         """Init adapter; optionally run health check and fail if requested."""
         self.adapter_name = self.__class__.__name__
         self._stub = False
-        self._init_time = pd.Timestamp.now()
+        self._init_time = datetime.now()
         self._health_check_passed = False
         self._health_check_message = "Not Tested"
+        self._report_buf = None
 
         if health_check:
-            if not self._run_health_check() and fail_on_error:
+            if not self._run_buffered_health_check() and fail_on_error:
                 raise RuntimeError(f"Health Check failed: {self._health_check_message}")
 
+    def _run_buffered_health_check(self) -> bool:
+        """Run the health check and write its whole report to stdout in one call."""
+        self._report_buf = io.StringIO()
+        try:
+            return self._run_health_check()
+        finally:
+            sys.stdout.write(self._report_buf.getvalue())
+            self._report_buf = None
+
+    def _report(self, *args, **kwargs):
+        """print() into the pending health-check report, or to stdout if none is pending."""
+        print(*args, file=self._report_buf if self._report_buf is not None else sys.stdout, **kwargs)
+
     @abstractmethod
     def _run_health_check(self) -> bool:
         """Run adapter-specific health check; must set _health_check_* attributes."""
@@ -58,16 +74,16 @@ class APIDataAdapter(baseDataAdapter):
 
     def _run_health_check(self) -> bool:
         """Run generic 3-step health check: key, connection, response."""
-        print(f"\n{'='*60}\n{self.adapter_name} Health Check\n{'='*60}")
+        self._report(f"\n{'='*60}\n{self.adapter_name} Health Check\n{'='*60}")
 
-        print("\n[1/3] Checking API key...", end=" ")
+        self._report("\n[1/3] Checking API key...", end=" ")
         if not self.api_key:
-            print("Failed (no API key found)")
+            self._report("Failed (no API key found)")
             self._health_check_passed = False
             self._health_check_message = f"No {self.api_key_env_var} found in environment"
-            print(f"\n{'='*60}\nHealth Check Failed - No API key configured\n{'='*60}\n")
+            self._report(f"\n{'='*60}\nHealth Check Failed - No API key configured\n{'='*60}\n")
             return False
-        print("Success")
+        self._report("Success")
         return self._test_api_connection()
 
     @abstractmethod
@@ -2,22 +2,36 @@
 News API adapter with sentiment classification using a 5-step prompt chain.
 """
 
+import copy
 import logging
 import os
 import re
 import time
-from typing import Any, Dict, List
-import pandas as pd
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import requests
 
 from .base import APIDataAdapter
 
+_MAX_PAGE_SIZE = 100  # NewsAPI upper bound for pageSize
+_MONEY_RE = re.compile(r'\$\s?\d+(?:\.\d+)?')
+_WS_RE = re.compile(r'\s+')
+_STUB_CHAIN_CACHE: Dict[str, Dict] = {}  # ticker -> run_chain result for stub articles
+
+
+def _utc_isoformat(ts: int) -> str:
+    """Format epoch seconds as a UTC ISO-8601 string."""
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
 
 class NewsAdapter(APIDataAdapter):
     """Fetches news from NewsAPI and performs keyword-based sentiment analysis."""
 
     POS = ('beat', 'raise', 'growth', 'record', 'surge', 'expand')
     NEG = ('miss', 'cut', 'decline', 'lawsuit', 'drop', 'recall', 'probe')
+    _POS_RE = re.compile('|'.join(map(re.escape, POS)), re.IGNORECASE)
+    _NEG_RE = re.compile('|'.join(map(re.escape, NEG)), re.IGNORECASE)
 
     def __init__(self, health_check: bool = False, fail_on_error: bool = False):
         """Init adapter and optionally run health check."""
@@ -28,9 +42,9 @@ class NewsAdapter(APIDataAdapter):
 
     def _test_api_connection(self) -> bool:
         """Check API key, connection, and response validity."""
-        print(f"\n{'='*60}\n{self.adapter_name} Health Check\n{'='*60}")
+        self._report(f"\n{'='*60}\n{self.adapter_name} Health Check\n{'='*60}")
 
-        print("[2/3] Testing API connection...", end=" ")
+        self._report("[2/3] Testing API connection...", end=" ")
         try:
             r = self.session.get(
                 'https://newsapi.org/v2/everything',
@@ -39,31 +53,31 @@ class NewsAdapter(APIDataAdapter):
                 timeout=10
             )
             r.raise_for_status()
-            print("Success")
+            self._report("Success")
         except Exception as e:
-            print(f"Failed ({type(e).__name__})")
+            self._report(f"Failed ({type(e).__name__})")
             self._health_check_passed = False
             self._health_check_message = f"API connection failed: {type(e).__name__}"
-            print(f"\n{'='*60}\nHealth Check Failed\n{'='*60}\n")
+            self._report(f"\n{'='*60}\nHealth Check Failed\n{'='*60}\n")
             return False
 
-        print("[3/3] Verifying response data...", end=" ")
+        self._report("[3/3] Verifying response data...", end=" ")
         try:
             if isinstance(r.json().get('articles', []), list):
-                print("Success")
+                self._report("Success")
                 self._health_check_passed = True
                 self._health_check_message = "News API operational"
             else:
-                print("Warning")
+                self._report("Warning")
                 self._health_check_passed = False
                 self._health_check_message = "Unexpected response format"
         except Exception as e:
-            print(f"Failed ({type(e).__name__})")
+            self._report(f"Failed ({type(e).__name__})")
             self._health_check_passed = False
             self._health_check_message = f"Response parsing failed: {type(e).__name__}"
 
         status = "Passed" if self._health_check_passed else "Failed"
-        print(f"\n{'='*60}\nHealth Check {status}\n{'='*60}\n")
+        self._report(f"\n{'='*60}\nHealth Check {status}\n{'='*60}\n")
         return self._health_check_passed
 
     def _get_stub_data(self, ticker: str, *args, **kwargs) -> List[Dict[str, Any]]:
@@ -74,13 +88,13 @@ class NewsAdapter(APIDataAdapter):
                 'title': f'[Stub] Growth story for {ticker}',
                 'description': f'{ticker} gains as services growth improves',
                 'content': '...',
-                'publishedAt': pd.Timestamp.utcfromtimestamp(now).isoformat()
+                'publishedAt': _utc_isoformat(now)
             },
             {
                 'title': f'[Stub] Miss story for {ticker}',
                 'description': f'{ticker} faces supply chain miss and margin pressure',
                 'content': '...',
-                'publishedAt': pd.Timestamp.utcfromtimestamp(now - 3600).isoformat()
+                'publishedAt': _utc_isoformat(now - 3600)
             }
         ]
 
@@ -105,50 +119,102 @@ class NewsAdapter(APIDataAdapter):
             logging.error(f'News API error: {e}')
             return self._get_stub_data(ticker)
 
+    def _ingest_batch(self, tickers: List[str], window_days: int = 7) -> Optional[List[Dict[str, Any]]]:
+        """Fetch news for several tickers with one OR query; None on failure."""
+        query = ' OR '.join(f'"{t}"' if ' ' in t else t for t in tickers)
+        try:
+            r = self.session.get(
+                'https://newsapi.org/v2/everything',
+                headers={'X-Api-Key': self.key},
+                params={
+                    'q': query,
+                    'language': 'en',
+                    'pageSize': min(_MAX_PAGE_SIZE, 50 * len(tickers)),
+                    'sortBy': 'publishedAt'
+                },
+                timeout=20
+            )
+            r.raise_for_status()
+            articles = r.json().get('articles', [])
+            logging.info(f'Fetched {len(articles)} articles for {len(tickers)} tickers')
+            return articles
+        except Exception as e:
+            logging.error(f'News API error: {e}')
+            return None
+
+    def _bucket_by_ticker(self, items: List[Dict], tickers: List[str]) -> Dict[str, List[int]]:
+        """Map each ticker to the indices of articles mentioning it as a whole word in title or description."""
+        lowered = {t.lower(): t for t in tickers}
+        alternation = '|'.join(map(re.escape, sorted(lowered, key=len, reverse=True)))
+        pattern = re.compile(rf'(?<!\w)(?:{alternation})(?!\w)', re.IGNORECASE)
+        buckets: Dict[str, List[int]] = {t: [] for t in tickers}
+
+        for i, article in enumerate(items):
+            haystack = f"{article.get('title') or ''} {article.get('description') or ''}"
+            for key in {m.group().lower() for m in pattern.finditer(haystack)}:
+                buckets[lowered[key]].append(i)
+        return buckets
+
+    def _preprocess_one(self, article: Dict) -> str:
+        """Clean and normalize one article's text."""
+        joined = ' '.join(str(article.get(f) or '') for f in ('title', 'description', 'content'))
+        return _WS_RE.sub(' ', joined).strip()
+
+    def _classify_one(self, t: str) -> str:
+        """Classify one text's sentiment by case-insensitive keyword presence."""
+        has_pos = self._POS_RE.search(t) is not None
+        has_neg = self._NEG_RE.search(t) is not None
+        if has_pos and has_neg:
+            return 'mixed'
+        elif has_pos:
+            return 'positive'
+        elif has_neg:
+            return 'negative'
+        else:
+            return 'neutral'
+
+    def _extract_one(self, t: str) -> Dict:
+        """Extract monetary entities from one text."""
+        return {'money': list(dict.fromkeys(_MONEY_RE.findall(t)))}
+
+    def _process_one(self, article: Dict, seen: Optional[Dict[str, Tuple[str, Dict]]] = None) -> Tuple[str, str, Dict]:
+        """Preprocess, classify and extract one article; reuse results for texts already in seen."""
+        text = self._preprocess_one(article)
+        if seen is None:
+            return text, self._classify_one(text), self._extract_one(text)
+        if text not in seen:
+            seen[text] = (self._classify_one(text), self._extract_one(text))
+        label, entities = seen[text]
+        return text, label, entities
+
     def _preprocess(self, items: List[Dict]) -> List[str]:
         """Clean and normalize article text."""
-        return [
-            re.sub(r'\s+', ' ', ' '.join([
-                str(a.get('title', '')),
-                str(a.get('description', '')),
-                str(a.get('content', ''))
-            ])).strip().lower()
-            for a in items
-        ]
+        return [self._preprocess_one(a) for a in items]
 
     def _classify(self, texts: List[str]) -> List[str]:
         """Classify sentiment by keyword presence."""
-        def classify_text(t):
-            has_pos = any(k in t for k in self.POS)
-            has_neg = any(k in t for k in self.NEG)
-            if has_pos and has_neg:
-                return 'mixed'
-            elif has_pos:
-                return 'positive'
-            elif has_neg:
-                return 'negative'
-            else:
-                return 'neutral'
-        return [classify_text(t) for t in texts]
+        return [self._classify_one(t) for t in texts]
 
     def _extract(self, texts: List[str]) -> List[Dict]:
         """Extract monetary entities from text."""
-        return [{'money': list(set(re.findall(r'\$\s?\d+(?:\.\d+)?', t)))} for t in texts]
+        return [self._extract_one(t) for t in texts]
 
     def _summarize(self, labels: List[str], texts: List[str], k: int = 2) -> Dict:
         """Summarize sentiment counts and sample snippets."""
+        c = Counter(labels)
         return {
             'summary_text': '...',
-            'counts': {s: labels.count(s) for s in ['mixed', 'positive', 'negative', 'neutral']},
+            'counts': {s: c.get(s, 0) for s in ('mixed', 'positive', 'negative', 'neutral')},
             'snippets': [f'- {labels[i]}: {texts[i][:100]}...' for i in range(min(k, len(texts)))]
         }
 
-    def run_chain(self, ticker: str, window_days: int = 7) -> Dict:
-        """Run full pipeline: Ingest → Preprocess → Classify → Extract → Summarize."""
-        items = self._ingest(ticker, window_days)
-        texts = self._preprocess(items)
-        labels = self._classify(texts)
-        extracts = self._extract(texts)
+    def _assemble(self, processed: Iterable[Tuple[str, str, Dict]], is_stub: bool) -> Dict:
+        """Summarize processed (text, label, entities) tuples into a chain result."""
+        texts, labels, extracts = [], [], []
+        for text, label, entities in processed:
+            texts.append(text)
+            labels.append(label)
+            extracts.append(entities)
         summary = self._summarize(labels, texts)
 
         return {
@@ -159,5 +225,40 @@ class NewsAdapter(APIDataAdapter):
                 for i in range(min(3, len(texts)))
             ],
             'summary': summary,
-            'is_stub': self.session is None or len(items) == 2
+            'is_stub': is_stub
         }
+
+    def _chain_result(self, items: List[Dict], is_stub: bool) -> Dict:
+        """Preprocess, classify, extract and summarize ingested articles."""
+        seen: Dict[str, Tuple[str, Dict]] = {}
+        return self._assemble((self._process_one(a, seen) for a in items), is_stub)
+
+    def _stub_chain_result(self, ticker: str) -> Dict:
+        """Return the chain result for stub articles, computed once per ticker."""
+        if ticker not in _STUB_CHAIN_CACHE:
+            _STUB_CHAIN_CACHE[ticker] = self._chain_result(self._get_stub_data(ticker), is_stub=True)
+        return copy.deepcopy(_STUB_CHAIN_CACHE[ticker])
+
+    def run_chain(self, ticker: str, window_days: int = 7) -> Dict:
+        """Run full pipeline: Ingest → Preprocess → Classify → Extract → Summarize."""
+        if self.session is None:
+            logging.warning(f'Using stub news data for {ticker}')
+            return self._stub_chain_result(ticker)
+
+        items = self._ingest(ticker, window_days)
+        return self._chain_result(items, is_stub=len(items) == 2)
+
+    def run_chain_batch(self, tickers: List[str], window_days: int = 7) -> Dict[str, Dict]:
+        """Run the chain for several tickers off a single NewsAPI request."""
+        tickers = list(dict.fromkeys(tickers))
+        if self.session is None:
+            return {t: self.run_chain(t, window_days) for t in tickers}
+
+        items = self._ingest_batch(tickers, window_days)
+        if items is None:
+            return {t: self._stub_chain_result(t) for t in tickers}
+
+        seen: Dict[str, Tuple[str, Dict]] = {}
+        processed = [self._process_one(a, seen) for a in items]
+        buckets = self._bucket_by_ticker(items, tickers)
+        return {t: self._assemble((processed[i] for i in buckets[t]), is_stub=False) for t in tickers}
@@ -0,0 +1,22 @@
+"""
+Concurrent dispatch of independent, I/O-bound adapter calls.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict
+
+
+def gather(ticker: str, adapters: Dict[str, Callable[[str], Any]], max_workers: int = 4) -> Dict[str, Any]:
+    """Call each named fetcher with ticker concurrently; failed calls map to None."""
+    results: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(fetch, ticker): name for name, fetch in adapters.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logging.error(f'{name} fetch failed for {ticker}: {type(e).__name__}: {e}')
+                results[name] = None
+    return {name: results[name] for name in adapters}
@@ -6,6 +6,8 @@ import logging
 import os
 from typing import Any, Dict, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base import APIDataAdapter
 
@@ -16,13 +18,19 @@ class SECAdapter(APIDataAdapter):
     def __init__(self, health_check: bool = False, fail_on_error: bool = False):
         """Init adapter and optionally run health check."""
         self.base_url = 'https://api.sec-api.io'
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        ))
         super().__init__('SEC_API_KEY', health_check, fail_on_error)
 
     def _test_api_connection(self) -> bool:
         """Run SEC API connection and response validation."""
-        print("[2/3] Testing API connection...", end=" ")
+        self._report("[2/3] Testing API connection...", end=" ")
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/',
                 params={
                     'query': 'ticker:AAPL AND formType:"10-K"',
@@ -34,31 +42,31 @@ class SECAdapter(APIDataAdapter):
                 timeout=10
             )
             response.raise_for_status()
-            print("Success")
+            self._report("Success")
         except Exception as e:
-            print(f"Failed ({type(e).__name__})")
+            self._report(f"Failed ({type(e).__name__})")
             self._health_check_passed = False
             self._health_check_message = f"API connection failed: {type(e).__name__}"
-            print(f"\n{'='*60}\nHealth Check Failed\n{'='*60}\n")
+            self._report(f"\n{'='*60}\nHealth Check Failed\n{'='*60}\n")
             return False
 
-        print("[3/3] Verifying response data...", end=" ")
+        self._report("[3/3] Verifying response data...", end=" ")
         try:
             if isinstance(response.json().get('filings', []), list):
-                print("Success")
+                self._report("Success")
                 self._health_check_passed = True
                 self._health_check_message = "SEC API operational"
             else:
-                print("Warning")
+                self._report("Warning")
                 self._health_check_passed = False
                 self._health_check_message = "Unexpected response format"
         except Exception as e:
-            print(f"Failed ({type(e).__name__})")
+            self._report(f"Failed ({type(e).__name__})")
             self._health_check_passed = False
             self._health_check_message = f"Response parsing failed: {type(e).__name__}"
 
         status = "Passed" if self._health_check_passed else "Failed"
-        print(f"\n{'='*60}\nHealth Check {status}\n{'='*60}\n")
+        self._report(f"\n{'='*60}\nHealth Check {status}\n{'='*60}\n")
         return self._health_check_passed
 
     def _get_stub_data(self, ticker: str, limit: int = 3, *args, **kwargs) -> List[Dict[str, Any]]:
@@ -86,7 +94,7 @@ class SECAdapter(APIDataAdapter):
             form_query = ' OR '.join([f'formType:"{ft}"' for ft in form_types])
             query = f'ticker:{ticker} AND ({form_query})'
 
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/',
                 params={
                     'query': query,
@@ -3,12 +3,31 @@ Yahoo Finance adapter for fetching stock prices and company info via yfinance.
 """
 
 import logging
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Tuple
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
 from .base import baseDataAdapter
+from .parallel import gather
+
+_OHLC_MULTIPLIERS = np.array([[1.0], [0.99], [1.01], [0.98]])  # Close, Open, High, Low vs. stub price
+_INFO_TTL = 300  # seconds a fetched t.info dict is reused
+_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _cached_info(symbol: str) -> Dict[str, Any]:
+    """Return t.info for symbol, reusing a non-empty result fetched within the last _INFO_TTL seconds."""
+    now = time.monotonic()
+    hit = _info_cache.get(symbol)
+    if hit and now - hit[0] < _INFO_TTL:
+        return hit[1]
+    # Fresh Ticker per fetch: yfinance memoizes info on the object, so a shared one would never expire.
+    info = yf.Ticker(symbol).info or {}
+    if info:
+        _info_cache[symbol] = (now, info)
+    return info
 
 
 class YahooFinanceAdapter(baseDataAdapter):
@@ -21,57 +40,57 @@ class YahooFinanceAdapter(baseDataAdapter):
 
     def _run_health_check(self) -> bool:
         """Verify Yahoo Finance connectivity and data integrity."""
-        print(f"\n{'='*60}\n{self.adapter_name} Health Check\n{'='*60}")
-        print(f"Testing with ticker: {self.test_ticker}")
-        print(f"Test initiated at: {self._init_time}")
+        self._report(f"\n{'='*60}\n{self.adapter_name} Health Check\n{'='*60}")
+        self._report(f"Testing with ticker: {self.test_ticker}")
+        self._report(f"Test initiated at: {self._init_time}")
 
         test_ticker = self._sanitize_ticker(self.test_ticker)
 
         try:
-            print("\n[1/4] Creating ticker object...", end=" ")
+            self._report("\n[1/4] Creating ticker object...", end=" ")
             t = yf.Ticker(test_ticker)
-            print("Success")
+            self._report("Success")
 
-            print("[2/4] Fetching ticker info...", end=" ")
+            self._report("[2/4] Fetching ticker info...", end=" ")
             try:
                 info = t.info
                 if info and len(info) > 5:
-                    print(f"Success ({info.get('longName', info.get('shortName', 'N/A'))})")
+                    self._report(f"Success ({info.get('longName', info.get('shortName', 'N/A'))})")
                 else:
-                    print("Warning (minimal info)")
+                    self._report("Warning (minimal info)")
             except Exception as e:
-                print(f"Warning ({type(e).__name__})")
+                self._report(f"Warning ({type(e).__name__})")
 
-            print("[3/4] Fetching price history (5 days)...", end=" ")
+            self._report("[3/4] Fetching price history (5 days)...", end=" ")
             hist = t.history(period='5d', auto_adjust=False, actions=False)
             if hist is not None and not hist.empty:
                 latest_date = hist.index[-1].date()
                 latest_price = hist['Close'].iloc[-1]
-                print(f"Success ({len(hist)} days, latest ${latest_price:.2f} on {latest_date})")
+                self._report(f"Success ({len(hist)} days, latest ${latest_price:.2f} on {latest_date})")
 
-                print("[4/4] Verifying data quality...", end=" ")
+                self._report("[4/4] Verifying data quality...", end=" ")
                 if 'Close' in hist.columns:
-                    print("Success")
+                    self._report("Success")
                     self._health_check_passed = True
                     self._health_check_message = "Yahoo Finance operational"
                 else:
-                    print("Warning (unexpected structure)")
+                    self._report("Warning (unexpected structure)")
                     self._health_check_passed = False
             else:
-                print("Failed (empty data)")
+                self._report("Failed (empty data)")
                 self._health_check_passed = False
                 self._health_check_message = "Empty data returned"
 
         except Exception as e:
-            print(f"Failed ({type(e).__name__}: {str(e)[:60]})")
+            self._report(f"Failed ({type(e).__name__}: {str(e)[:60]})")
             self._health_check_passed = False
             self._health_check_message = f"Health check failed: {type(e).__name__}: {str(e)[:100]}"
 
         status = "Passed" if self._health_check_passed else "Failed"
-        print(f"\n{'='*60}\nHealth Check {status}")
+        self._report(f"\n{'='*60}\nHealth Check {status}")
         if not self._health_check_passed:
-            print(f"Reason: {self._health_check_message}")
-        print(f"{'='*60}\n")
+            self._report(f"Reason: {self._health_check_message}")
+        self._report(f"{'='*60}\n")
 
         return self._health_check_passed
 
@@ -127,8 +146,11 @@ class YahooFinanceAdapter(baseDataAdapter):
             df.columns = ['_'.join([str(p) for p in t if p]).strip() for t in df.columns]
 
         if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            df = df.dropna(subset=['Date']).sort_values('Date')
+            if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+                df['Date'] = pd.to_datetime(df['Date'], errors='coerce', utc=False)
+            if df['Date'].isna().any():
+                df = df.dropna(subset=['Date'])
+            df = df.sort_values('Date')
         if 'Close' in df.columns:
             df = df.dropna(subset=['Close'])
 
@@ -137,18 +159,19 @@ class YahooFinanceAdapter(baseDataAdapter):
     def _get_stub_data(self, ticker: str, error: str = None, *args, **kwargs) -> pd.DataFrame:
         """Generate synthetic random-walk price data for fallback."""
         idx = pd.date_range(end=pd.Timestamp.today(), periods=30, freq='D')
-        np.random.seed(hash(ticker) % (2**32))
+        rng = np.random.default_rng(hash(ticker) & 0xFFFFFFFF)
 
         base_price = 100 + (hash(ticker) % 200)
-        prices = base_price * np.exp(np.cumsum(np.random.normal(0.001, 0.02, len(idx))))
+        prices = base_price * np.exp(np.cumsum(rng.standard_normal(len(idx)) * 0.02 + 0.001))
+        close, open_, high, low = _OHLC_MULTIPLIERS * prices
 
         df = pd.DataFrame({
             'Date': idx,
-            'Close': prices,
-            'Open': prices * 0.99,
-            'High': prices * 1.01,
-            'Low': prices * 0.98,
-            'Volume': np.random.randint(1e6, 1e8, len(idx))
+            'Close': close,
+            'Open': open_,
+            'High': high,
+            'Low': low,
+            'Volume': rng.integers(int(1e6), int(1e8), len(idx))
         })
 
         df['source'] = 'stub_fallback'
@@ -160,6 +183,16 @@ class YahooFinanceAdapter(baseDataAdapter):
             logging.warning(f'[Stub] Generated data for {ticker}')
         return df
 
+    def fetch_all(self, ticker: str) -> Dict[str, Any]:
+        """Fetch prices, info and all three statements for a ticker concurrently."""
+        return gather(ticker, {
+            'prices': self.fetch_prices,
+            'info': self.fetch_info,
+            'financials': self.fetch_financials,
+            'balance_sheet': self.fetch_balance_sheet,
+            'cashflow': self.fetch_cashflow,
+        })
+
     def fetch_info(self, ticker: str) -> Dict[str, Any]:
         """Fetch company info and fundamentals or stub on failure."""
         ticker = self._sanitize_ticker(ticker)
@@ -167,9 +200,8 @@ class YahooFinanceAdapter(baseDataAdapter):
             return {'stub': True, 'ticker': ticker}
 
         try:
-            t = yf.Ticker(ticker)
             # Always use full info (not fast_info) to get complete data including P/E, 52-week ranges, etc.
-            info = t.info or {}
+            info = dict(_cached_info(ticker))
             info['source'] = 'info'
             logging.info(f'Fetched info for {ticker} with {len(info)} fields')
             return info